@@ -10,7 +10,7 @@ Primary command families (for Discord slash command mapping):
   model add <provider> <id> [aliases...]
   model remove <provider> <id>
   model export
-  model reload
+  model reload [--refresh-remote]
   model help
 
 Compatibility commands:
@@ -19,23 +19,65 @@ Compatibility commands:
   set <modelOrAlias> [--dry-run] [--validate-mode local|remote|none]
   rollback <backup_file>
 """
+import functools
 import json
+import os
 import re
-import subprocess
 import sys
 import time
 from pathlib import Path
 from typing import Any
 
+# Heavier and optional modules (asyncio, subprocess, orjson, requests, ijson, python-systemd,
+# inotify_simple, ...) are imported where used so `current` / `model show` start fast.
+
 CONFIG = Path("/root/.openclaw/openclaw.json")
 BACKUP_DIR = Path("/root/.openclaw/backups")
 MODELS_PATH = Path(__file__).with_name("models.json")
 ALIAS_PATH = Path(__file__).with_name("model_aliases.json")
+_ALIAS_INDEX_CACHE = MODELS_PATH.with_suffix(".aliases.pkl")
 LOG_DIR = Path("/tmp/openclaw")
+OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
+_CATALOG_CACHE = Path("/root/.openclaw/cache/openrouter_models.json")
+_CATALOG_TTL = 3600
+# In-process copy of the cached id set, keyed on the cache file's mtime.
+_CATALOG_IDS: frozenset[str] | None = None
+_CATALOG_MTIME: int | None = None
 DEFAULT_MODEL = "anthropic/claude-sonnet-4-6"
+_PROVIDER_PREFIXES = ("anthropic/", "openrouter/", "openai/", "google/", "xai/", "deepseek/")
+_BAD_MODEL_RE = re.compile(r"Unknown model:|model not found|404.*model", re.IGNORECASE)
+_BAD_MODEL_BYTES_RE = re.compile(rb"Unknown model:|model not found|404.*model", re.IGNORECASE)
+
+
+@functools.cache
+def _json_codec():
+    """(loads, dumps) backed by orjson when installed, else stdlib json; resolved on first use."""
+    try:
+        import orjson
+    except ImportError:  # stdlib json fallback
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(obj, indent=2) + "\n"
+
+        return json.loads, dumps
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode() + "\n"
+
+    return orjson.loads, dumps
+
+
+def _loads(data: str | bytes) -> Any:
+    return _json_codec()[0](data)
+
+
+def _dumps(obj: Any) -> str:
+    return _json_codec()[1](obj)
 
 
 def sh(cmd, check=True, capture=True, timeout=30):
+    import subprocess
+
     r = subprocess.run(
         cmd,
         check=check,
@@ -47,28 +89,112 @@ def sh(cmd, check=True, capture=True, timeout=30):
     return r.stdout or ""
 
 
+async def ash(cmd, check=True, timeout=30) -> str:
+    """Async counterpart of sh(): run cmd, return combined stdout/stderr."""
+    import asyncio
+    import subprocess
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    try:
+        out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    text = out.decode("utf-8", errors="replace")
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=text)
+    return text
+
+
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    """Replace path with data via a unique sibling temp file + fsync + rename, so readers never see a torn file.
+
+    Symlinks are followed, and the temp file takes the target's mode and owner before the rename:
+    openclaw.json holds API tokens and must not become world-readable. New files are created 0600.
+    """
+    import tempfile
+
+    path = path.resolve()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                pass
+            else:
+                os.fchmod(f.fileno(), st.st_mode & 0o7777)
+                try:
+                    os.fchown(f.fileno(), st.st_uid, st.st_gid)
+                except PermissionError:
+                    pass
+            f.write(data.encode() if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def load_config() -> dict[str, Any]:
-    return json.loads(CONFIG.read_text())
+    # Stdlib json on purpose: importing orjson costs more than it saves on this small read-only path.
+    return json.loads(CONFIG.read_bytes())
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are part of the cache key so edits invalidate naturally.
+    return _loads(Path(path_str).read_bytes())
 
 
 def load_models() -> dict[str, Any]:
-    if not MODELS_PATH.exists():
+    """Parsed registry, shared per file state: treat as read-only (see _load_models_for_edit)."""
+    key = _stat_key(MODELS_PATH)
+    if key is None:
         return {"providers": {}}
-    return json.loads(MODELS_PATH.read_text())
+    return _load_json_cached(str(MODELS_PATH), *key)
+
+
+def _load_models_for_edit() -> dict[str, Any]:
+    # Deep copy, so edits never leak into the memoized registry that get_alias_index trusts.
+    import copy
+
+    return copy.deepcopy(load_models())
 
 
 def save_models(registry: dict[str, Any]) -> None:
-    MODELS_PATH.write_text(json.dumps(registry, indent=2) + "\n")
+    _atomic_write(MODELS_PATH, _dumps(registry))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_aliases_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, str]:
+    try:
+        data = _load_json_cached(path_str, mtime_ns, size)
+        return {str(k).strip().lower(): str(v).strip() for k, v in data.items()}
+    except Exception:
+        return {}
 
 
 def load_aliases() -> dict[str, str]:
-    if ALIAS_PATH.exists():
-        try:
-            data = json.loads(ALIAS_PATH.read_text())
-            return {str(k).strip().lower(): str(v).strip() for k, v in data.items()}
-        except Exception:
-            return {}
-    return {}
+    key = _stat_key(ALIAS_PATH)
+    if key is None:
+        return {}
+    return _load_aliases_cached(str(ALIAS_PATH), *key)
 
 
 def provider_from_model(model_id: str) -> str | None:
@@ -99,15 +225,51 @@ def build_alias_index(registry: dict[str, Any]) -> dict[str, str]:
     return aliases
 
 
+@functools.lru_cache(maxsize=8)
+def _alias_index_cached(models_key: tuple[int, int], aliases_key: tuple[int, int] | None) -> dict[str, str]:
+    # Reuse the pickled index when it was built from the same registry/alias file state.
+    import pickle
+
+    key = (models_key, aliases_key)
+    try:
+        cached = pickle.loads(_ALIAS_INDEX_CACHE.read_bytes())
+        if cached.get("key") == key:
+            return cached["index"]
+    except Exception:
+        pass
+    index = build_alias_index(load_models())
+    try:
+        _atomic_write(_ALIAS_INDEX_CACHE, pickle.dumps({"key": key, "index": index}, pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return index
+
+
+def get_alias_index(registry: dict[str, Any] | None = None) -> dict[str, str]:
+    """Alias index for the on-disk registry, memoized in-process and pickled next to models.json."""
+    models_key = _stat_key(MODELS_PATH)
+    if models_key is not None and (registry is None or registry is load_models()):
+        return _alias_index_cached(models_key, _stat_key(ALIAS_PATH))
+    return build_alias_index(registry if registry is not None else load_models())
+
+
+def _registry_has_id(model_id: str, registry: dict[str, Any]) -> bool:
+    # Direct scan of the owning provider's models; no alias index needed.
+    pdata = registry.get("providers", {}).get(provider_from_model(model_id), {})
+    return any(item.get("id") == model_id for item in pdata.get("models", []))
+
+
 def normalize_model(raw: str, registry: dict[str, Any]) -> str:
     token = raw.strip()
     if not token:
         return token
-    alias_index = build_alias_index(registry)
-    resolved = alias_index.get(token.lower(), token)
+    if token.lower().startswith(_PROVIDER_PREFIXES) and _registry_has_id(token, registry):
+        resolved = token
+    else:
+        resolved = get_alias_index(registry).get(token.lower(), token)
 
     # Legacy behavior: openrouter IDs without prefix map to openrouter/<id>
-    if "/" in resolved and not resolved.lower().startswith(("anthropic/", "openrouter/", "openai/", "google/", "xai/", "deepseek/")):
+    if "/" in resolved and not resolved.lower().startswith(_PROVIDER_PREFIXES):
         resolved = f"openrouter/{resolved}"
 
     if resolved.startswith("anthropic/"):
@@ -118,8 +280,94 @@ def normalize_model(raw: str, registry: dict[str, Any]) -> str:
 
 
 def local_model_exists(model_id: str, registry: dict[str, Any]) -> bool:
-    alias_index = build_alias_index(registry)
-    return model_id.lower() in alias_index
+    if _registry_has_id(model_id, registry):
+        return True
+    return model_id.lower() in get_alias_index(registry)
+
+
+@functools.cache
+def _http_session():
+    """Keep-alive session so repeated catalog fetches reuse one TCP+TLS connection; None without requests."""
+    try:
+        import requests
+    except ImportError:  # curl fallback
+        return None
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+def _fetch_openrouter_ids(validators: dict[str, str]) -> tuple[list[str] | None, dict[str, str]]:
+    """Fetch catalog ids; returns (None, validators) when the server answers 304 Not Modified."""
+    session = _http_session()
+    if session is not None:
+        try:
+            import ijson
+        except ImportError:  # full json decode fallback
+            ijson = None
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        with session.get(OPENROUTER_MODELS_URL, headers=headers, timeout=20, stream=True) as r:
+            if r.status_code == 304:
+                return None, validators
+            r.raise_for_status()
+            new_validators = {
+                k: v
+                for k, v in (("etag", r.headers.get("ETag")), ("last_modified", r.headers.get("Last-Modified")))
+                if v
+            }
+            if ijson is not None:
+                # Stream-decode only the ids instead of buffering the >1 MB catalog.
+                r.raw.decode_content = True
+                ids = {mid for mid in ijson.items(r.raw, "data.item.id") if mid}
+            else:
+                ids = {m["id"] for m in r.json().get("data", []) if m.get("id")}
+            return sorted(ids), new_validators
+    data = _loads(sh(["curl", "-sf", OPENROUTER_MODELS_URL], timeout=20))
+    return sorted({m["id"] for m in data.get("data", []) if m.get("id")}), {}
+
+
+def _write_catalog_cache(ids: list[str], validators: dict[str, str]) -> None:
+    _CATALOG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(_CATALOG_CACHE, _dumps({"fetched": int(time.time()), "ids": ids, **validators}))
+
+
+def openrouter_catalog_ids(refresh: bool = False) -> frozenset[str]:
+    global _CATALOG_IDS, _CATALOG_MTIME
+    # Serve from the on-disk cache while fresh; the catalog changes slowly.
+    cached: dict[str, Any] = {}
+    try:
+        st = _CATALOG_CACHE.stat()
+        if not refresh and time.time() - st.st_mtime < _CATALOG_TTL:
+            if _CATALOG_IDS is None or _CATALOG_MTIME != st.st_mtime_ns:
+                _CATALOG_IDS = frozenset(_loads(_CATALOG_CACHE.read_bytes()).get("ids", []))
+                _CATALOG_MTIME = st.st_mtime_ns
+            return _CATALOG_IDS
+        if not refresh:
+            cached = _loads(_CATALOG_CACHE.read_bytes())
+    except (OSError, ValueError):
+        pass
+    # Revalidate an expired cache with a conditional GET; a 304 keeps the cached ids.
+    validators = {k: cached[k] for k in ("etag", "last_modified") if cached.get(k) and cached.get("ids")}
+    try:
+        ids, validators = _fetch_openrouter_ids(validators)
+    except Exception:
+        # OpenRouter down or slow: a stale catalog beats failing validation outright.
+        if cached.get("ids"):
+            return frozenset(cached["ids"])
+        raise
+    if ids is None:
+        ids = cached["ids"]
+    _CATALOG_IDS = frozenset(ids)
+    try:
+        _write_catalog_cache(ids, validators)
+        _CATALOG_MTIME = _CATALOG_CACHE.stat().st_mtime_ns
+    except OSError:
+        _CATALOG_MTIME = None
+    return _CATALOG_IDS
 
 
 def openrouter_has_model(model_id: str) -> bool:
@@ -127,10 +375,7 @@ def openrouter_has_model(model_id: str) -> bool:
     if model_id.startswith("openrouter/"):
         target = model_id[len("openrouter/") :]
     try:
-        out = sh(["curl", "-sf", "https://openrouter.ai/api/v1/models"], timeout=20)
-        data = json.loads(out)
-        ids = {m.get("id") for m in data.get("data", []) if m.get("id")}
-        return target in ids
+        return target in openrouter_catalog_ids()
     except Exception:
         return False
 
@@ -161,12 +406,14 @@ def validate_model(model_id: str, registry: dict[str, Any], mode: str) -> tuple[
     return False, f"Remote validation failed: {model_id}"
 
 
-def backup_config() -> Path:
+def backup_config() -> tuple[Path, dict[str, Any]]:
+    """Snapshot CONFIG to BACKUP_DIR and return the backup path plus the config parsed from the same bytes."""
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     ts = str(int(time.time()))
     dst = BACKUP_DIR / f"openclaw.json.{ts}.bak"
-    dst.write_text(CONFIG.read_text())
-    return dst
+    raw = CONFIG.read_bytes()
+    _atomic_write(dst, raw)
+    return dst, _loads(raw)
 
 
 def current_model(cfg: dict[str, Any]) -> str:
@@ -178,80 +425,253 @@ def current_model(cfg: dict[str, Any]) -> str:
     return cfg.get("agents", {}).get("defaults", {}).get("model", {}).get("primary", "(unknown)")
 
 
-def patch_config(model_id: str):
-    cfg = load_config()
-    cfg.setdefault("agents", {}).setdefault("defaults", {}).setdefault("model", {})
-    cfg["agents"]["defaults"]["model"]["primary"] = model_id
+class AgentsView:
+    """Direct references to the config nodes that carry the primary model."""
 
-    if cfg["agents"].get("defaults", {}).get("imageModel") is not None:
-        # Update only if existing and non-null.
-        cfg["agents"]["defaults"].setdefault("imageModel", {})
+    # Plain slotted class rather than @dataclass: dataclasses pulls in inspect at import time.
+    __slots__ = ("defaults_model", "main_models")
 
-    for agent in cfg["agents"].get("list", []):
-        if agent.get("id") == "main":
-            agent.setdefault("model", {})["primary"] = model_id
+    def __init__(self, defaults_model: dict[str, Any], main_models: list[dict[str, Any]]):
+        self.defaults_model = defaults_model
+        self.main_models = main_models
 
-    CONFIG.write_text(json.dumps(cfg, indent=2) + "\n")
+    @classmethod
+    def from_config(cls, cfg: dict[str, Any]) -> "AgentsView":
+        agents = cfg.setdefault("agents", {})
+        defaults_model = agents.setdefault("defaults", {}).setdefault("model", {})
+        main_models = [
+            agent.setdefault("model", {}) for agent in agents.get("list", []) if agent.get("id") == "main"
+        ]
+        return cls(defaults_model, main_models)
+
+    def set_primary(self, model_id: str) -> None:
+        self.defaults_model["primary"] = model_id
+        for model in self.main_models:
+            model["primary"] = model_id
+
+
+def patch_config(cfg: dict[str, Any], model_id: str) -> str:
+    AgentsView.from_config(cfg).set_primary(model_id)
+    text = _dumps(cfg)
+    _atomic_write(CONFIG, text)
+    return text
 
 
 def _today_log() -> Path:
     return LOG_DIR / f"openclaw-{time.strftime('%Y-%m-%d')}.log"
 
 
-def _log_size() -> int:
-    p = _today_log()
-    return p.stat().st_size if p.exists() else 0
+def _open_ro(path: Path) -> int | None:
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+class _LogTail:
+    """Incremental reader for today's gateway log: one fd, pread from an advancing cursor."""
+
+    __slots__ = ("path", "fd", "cursor")
+
+    def __init__(self):
+        self.path = _today_log()
+        self.fd = _open_ro(self.path)
+        self.cursor = os.fstat(self.fd).st_size if self.fd is not None else 0
+
+    def read_new(self) -> bytes:
+        """Return raw bytes appended since the previous call."""
+        path = _today_log()
+        if path != self.path:  # midnight rollover: follow the new day's file from its start
+            self.close()
+            self.path, self.cursor = path, 0
+        if self.fd is None:
+            self.fd = _open_ro(path)
+            if self.fd is None:
+                return b""
+        size = os.fstat(self.fd).st_size
+        if size < self.cursor:  # truncated
+            self.cursor = 0
+        if size == self.cursor:
+            return b""
+        window = os.pread(self.fd, size - self.cursor, self.cursor)
+        # Stop at the last complete line so a match split across polls is rescanned.
+        self.cursor += window.rfind(b"\n") + 1
+        return window
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def _open_gateway_journal():
+    """Open a journal reader positioned at "now" for the gateway unit, if python-systemd is available."""
+    try:
+        from systemd import journal
+    except ImportError:  # journalctl fallback
+        return None
+    try:
+        reader = journal.Reader()
+        reader.this_boot()
+        reader.add_match(_SYSTEMD_USER_UNIT="openclaw-gateway.service")
+        reader.seek_realtime(time.time())
+        return reader
+    except Exception:
+        return None
 
 
-def _read_log_from(offset: int) -> str:
-    p = _today_log()
-    if not p.exists():
-        return ""
-    with open(p, "rb") as f:
-        f.seek(offset)
-        return f.read().decode("utf-8", errors="replace")
+def _watch_log_dir():
+    """Watch LOG_DIR for writes/new files via inotify, if inotify_simple is available."""
+    try:
+        from inotify_simple import INotify, flags as inotify_flags
+    except ImportError:  # fixed 2s polling fallback
+        return None
+    try:
+        ino = INotify()
+        ino.add_watch(LOG_DIR, inotify_flags.MODIFY | inotify_flags.CREATE)
+        return ino
+    except OSError:
+        return None
 
 
-def restart_and_check(model_id: str) -> tuple[bool, str]:
-    pre_size = _log_size()
-    sh(["systemctl", "--user", "restart", "openclaw-gateway"], timeout=30)
+async def _wait_for_activity(ino, reader, woke: "asyncio.Event", timeout: float) -> None:
+    """Sleep up to timeout, waking early when the log dir or the gateway journal changes."""
+    import asyncio
 
-    deadline = time.time() + 25
-    while time.time() < deadline:
-        time.sleep(2)
-        new_text = _read_log_from(pre_size)
-        since = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(time.time() - 40))
-        jctl = sh(
-            [
-                "journalctl",
-                "--user",
-                "-u",
-                "openclaw-gateway",
-                "--since",
-                since,
-                "--no-pager",
-                "-n",
-                "200",
-            ],
-            check=False,
-        )
+    fds = [src.fileno() for src in (ino, reader) if src is not None]
+    loop = asyncio.get_running_loop()
+    for fd in fds:
+        loop.add_reader(fd, woke.set)
+    try:
+        await asyncio.wait_for(woke.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        for fd in fds:
+            loop.remove_reader(fd)
+    woke.clear()
+    # Acknowledge pending events so the fds stop polling readable.
+    if ino is not None:
+        ino.read(timeout=0)
+    if reader is not None:
+        reader.process()
+
+
+async def _follow_journal(lines: list[bytes], woke: "asyncio.Event"):
+    """Start one long-lived `journalctl --follow` for the gateway and pump its lines into `lines`."""
+    import asyncio
 
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "journalctl",
+            "--user",
+            "-u",
+            "openclaw-gateway",
+            "--since",
+            f"@{int(time.time())}",
+            "--follow",
+            "--no-pager",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None, None
+
+    async def pump():
+        # Fixed-size reads: StreamReader line iteration raises on lines over its 64 KiB limit.
+        # Only complete lines are published, so a match is never split across two polls.
+        pending = b""
+        while chunk := await proc.stdout.read(65536):
+            pending += chunk
+            end = pending.rfind(b"\n") + 1
+            if end:
+                lines.append(pending[:end])
+                pending = pending[end:]
+                woke.set()
+        if pending:
+            lines.append(pending)
+            woke.set()
+
+    def report(task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ Journal follower failed: {task.exception()!r}", file=sys.stderr)
+
+    task = asyncio.create_task(pump())
+    task.add_done_callback(report)
+    return proc, task
+
+
+def _read_journal(reader, lines: list[bytes]) -> str:
+    # Drain only the entries appended since the previous poll.
+    if reader is not None:
+        return "\n".join(str(entry.get("MESSAGE", "")) for entry in reader)
+    text = b"".join(lines).decode("utf-8", errors="replace")
+    lines.clear()
+    return text
+
+
+async def restart_and_check(model_id: str) -> tuple[bool, str]:
+    import asyncio
+
+    log_tail = _LogTail()
+    needle = f"agent model: {model_id}"
+    needle_bytes = needle.encode()
+    woke = asyncio.Event()
+    journal_lines: list[bytes] = []
+    reader = _open_gateway_journal()
+    ino = _watch_log_dir()
+    # Without python-systemd, tail the journal through a single follower started before the restart.
+    follower, pump = (None, None) if reader is not None else await _follow_journal(journal_lines, woke)
+    try:
+        await ash(["systemctl", "--user", "restart", "openclaw-gateway"], timeout=30)
+
+        deadline = time.time() + 25
+        while time.time() < deadline:
+            await _wait_for_activity(ino, reader, woke, min(deadline - time.time(), 2.0))
+            window = log_tail.read_new()
+            jctl = _read_journal(reader, journal_lines)
+
+            if _BAD_MODEL_BYTES_RE.search(window) or _BAD_MODEL_RE.search(jctl):
+                return False, "Unknown/invalid model detected in logs after restart."
+            if window.find(needle_bytes) != -1 or needle in jctl:
+                return True, f"Confirmed: {needle}"
+
+        # Post-mortem only: the unit state matters once the logs gave no verdict.
+        status = (await ash(["systemctl", "--user", "is-active", "openclaw-gateway"], check=False)).strip()
+    finally:
+        log_tail.close()
+        if reader is not None:
+            reader.close()
+        if ino is not None:
+            ino.close()
+        if follower is not None:
+            pump.cancel()
+            if follower.returncode is None:
+                follower.kill()
+            await follower.wait()
+
+    if status != "active":
+        return False, f"Gateway failed to stay active (status: {status})."
+    return False, f"Gateway active but '{needle}' not seen within 25s."
+
+
+def wait_gateway_active(timeout: float = 10.0) -> str:
+    """Poll `is-active` with a short backoff until the gateway is active or timeout; return the last status."""
+    deadline = time.time() + timeout
+    delay = 0.1
+    while True:
         status = sh(["systemctl", "--user", "is-active", "openclaw-gateway"], check=False).strip()
-        combined = new_text + "\n" + jctl
-
-        if re.search(r"Unknown model:|model not found|404.*model", combined, re.IGNORECASE):
-            return False, "Unknown/invalid model detected in logs after restart."
-        if f"agent model: {model_id}" in combined:
-            return True, f"Confirmed: agent model: {model_id}"
-        if status != "active":
-            return False, f"Gateway failed to stay active (status: {status})."
-
-    return False, f"Gateway active but 'agent model: {model_id}' not seen within 25s."
+        remaining = deadline - time.time()
+        if status == "active" or remaining <= 0:
+            return status
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
 
 
-def rollback_to(backup: Path):
-    CONFIG.write_text(backup.read_text())
+def rollback_to(backup: Path) -> str:
+    _atomic_write(CONFIG, backup.read_bytes())
     sh(["systemctl", "--user", "restart", "openclaw-gateway"], timeout=30)
+    return wait_gateway_active()
 
 
 def require_allowlisted(user_id: str | None):
@@ -285,7 +705,7 @@ def cmd_models(args: list[str]):
 
     providers = registry.get("providers", {})
     if as_json:
-        print(json.dumps(registry, indent=2))
+        print(_dumps(registry), end="")
         return
 
     if not provider or provider.startswith("--"):
@@ -327,14 +747,17 @@ def cmd_model_set(model_raw: str, dry_run: bool, validate_mode: str):
         print(f"🔍 DRY RUN — would switch to: {model_id}")
         return
 
-    backup = backup_config()
+    # Patch exactly the config that was backed up, read after validation.
+    backup, cfg = backup_config()
     print(f"💾 Config backed up to: {backup}")
 
-    patch_config(model_id)
+    patch_config(cfg, model_id)
     print(f"📝 Config updated with model: {model_id}")
 
     print("🔄 Restarting openclaw-gateway…")
-    ok, health = restart_and_check(model_id)
+    import asyncio
+
+    ok, health = asyncio.run(restart_and_check(model_id))
     if ok:
         print(f"✅ {health}")
         print(f"🎉 Successfully switched to: {model_id}")
@@ -342,8 +765,11 @@ def cmd_model_set(model_raw: str, dry_run: bool, validate_mode: str):
 
     print(f"❌ Healthcheck failed: {health}")
     print(f"⏪ Rolling back to: {backup}")
-    rollback_to(backup)
-    print("🔄 Gateway restarted with previous config.")
+    status = rollback_to(backup)
+    if status == "active":
+        print("🔄 Gateway restarted with previous config.")
+    else:
+        print(f"⚠️ Gateway restarted with previous config but is not active (status: {status}).")
     print(f"❌ Set failed — rolled back to backup: {backup}")
     sys.exit(3)
 
@@ -353,7 +779,7 @@ def cmd_model_reset(dry_run: bool, validate_mode: str):
 
 
 def cmd_model_add(provider: str, model_id: str, aliases: list[str]):
-    registry = load_models()
+    registry = _load_models_for_edit()
     providers = registry.setdefault("providers", {})
     pdata = providers.setdefault(provider, {"label": provider.title(), "models": []})
 
@@ -373,7 +799,7 @@ def cmd_model_add(provider: str, model_id: str, aliases: list[str]):
 
 
 def cmd_model_remove(provider: str, model_id: str):
-    registry = load_models()
+    registry = _load_models_for_edit()
     providers = registry.get("providers", {})
     if provider not in providers:
         print(f"❌ Unknown provider: {provider}")
@@ -394,11 +820,18 @@ def cmd_model_export():
     print(MODELS_PATH.read_text())
 
 
-def cmd_model_reload():
+def cmd_model_reload(refresh_remote: bool = False):
     registry = load_models()
     providers = registry.get("providers", {})
     count = sum(len(p.get("models", [])) for p in providers.values())
     print(f"✅ Reloaded models.json ({len(providers)} providers, {count} models)")
+    if refresh_remote:
+        try:
+            ids = openrouter_catalog_ids(refresh=True)
+        except Exception as e:
+            print(f"❌ Failed to refresh OpenRouter catalog: {e}")
+            sys.exit(2)
+        print(f"✅ Refreshed OpenRouter catalog cache ({len(ids)} models)")
 
 
 def cmd_validate(model_raw: str, validate_mode: str):
@@ -478,7 +911,7 @@ def main():
             return
         if sub == "reload":
             require_allowlisted(user_id)
-            cmd_model_reload()
+            cmd_model_reload(refresh_remote="--refresh-remote" in args)
             return
         if sub == "help":
             usage()
@@ -501,8 +934,10 @@ def main():
         if not b.exists():
             print(f"❌ Backup not found: {b}")
             sys.exit(2)
-        rollback_to(b)
+        status = rollback_to(b)
         print(f"✅ Rolled back to: {b}")
+        if status != "active":
+            print(f"⚠️ Gateway is not active after restart (status: {status}).")
         return
 
     usage()